@@ -28,7 +28,7 @@ def setup() -> tuple[MusifyConfig, dict[str, MusifyConfig]]:
     parsed_args = PARSER.parse_args()
 
     LOGGER.debug(f"Loading config from: {parsed_args.config}")
-    base, functions = MusifyConfig.from_file(parsed_args.config)
+    base, functions = MusifyConfig.from_file(parsed_args.config, cache_folder=parsed_args.config_cache)
 
     if func_names := parsed_args.functions:
         func_names = (name.replace("-", "_") for name in func_names)
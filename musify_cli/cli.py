@@ -5,7 +5,7 @@ from argparse import ArgumentParser
 from pathlib import Path
 
 from musify_cli import PROGRAM_NAME
-from musify_cli.config.core import Paths
+from musify_cli.config.core import Paths, DEFAULT_CONFIG_CACHE_PATH
 from musify_cli.manager import MusifyProcessor
 
 PARSER = ArgumentParser(PROGRAM_NAME)
@@ -17,6 +17,17 @@ PARSER.add_argument(
     help="The path to the configuration file for this execution"
 )
 
+PARSER.add_argument(
+    "--config-cache", type=Path, default=DEFAULT_CONFIG_CACHE_PATH,
+    help="The directory to cache parsed config files in to speed up loading on subsequent runs. "
+         "Cached files contain the full parsed config, including any credentials it holds. "
+         f"This location is not affected by the configured paths. Defaults to: {DEFAULT_CONFIG_CACHE_PATH}"
+)
+PARSER.add_argument(
+    "--no-config-cache", dest="config_cache", action="store_const", const=None,
+    help="Disable caching of parsed config files"
+)
+
 PROCESSOR_METHOD_NAMES = [
     name.replace("_", "-") for name in MusifyProcessor.__new__(MusifyProcessor).__processormethods__
 ]
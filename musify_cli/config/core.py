@@ -39,6 +39,9 @@ from musify_cli.config.operations.signature import get_default_args
 from musify_cli.config.operations.tags import LOCAL_TRACK_TAG_NAMES, LocalTrackFields, Tags
 from musify_cli.log.handlers import CurrentTimeRotatingFileHandler
 
+#: Escaped ANSI escape sequence as it is written in config files
+ANSI_ESCAPE_RAW = r"\33"
+
 
 ###########################################################################
 ## Runtime
@@ -101,9 +104,10 @@ class Logging(BaseModel):
     @model_validator(mode="after")
     def fix_ansi_codes_in_formatters(self) -> Self:
         """Reformat ANSI colour codes in formatter configurations"""
+        format_key = "format"
         for formatter in self.formatters.values():
-            if (format_key := "format") in formatter:
-                formatter[format_key] = formatter[format_key].replace(r"\33", "\33")
+            if ANSI_ESCAPE_RAW in (fmt := formatter.get(format_key, "")):
+                formatter[format_key] = fmt.replace(ANSI_ESCAPE_RAW, "\33")
 
         return self
 
@@ -149,10 +153,17 @@ class Logging(BaseModel):
             logging.getLogger(MODULE_ROOT).debug(f"Logging config set to: {self.name}")
 
 
+#: The default base directory to use for output data
+DEFAULT_BASE_PATH: Path = PACKAGE_ROOT.joinpath("_data")
+#: The default directory to cache parsed config files in.
+#: The configured paths are only known once the config has been loaded, so this location is fixed.
+DEFAULT_CONFIG_CACHE_PATH: Path = DEFAULT_BASE_PATH.joinpath("cache", "config")
+
+
 class Paths(BaseModel):
     base: DirectoryPath = Field(
         description="The base directory to use for output data e.g. backups, API tokens, caches etc.",
-        default=PACKAGE_ROOT.joinpath("_data"),
+        default=DEFAULT_BASE_PATH,
     )
     dt: datetime = Field(
         description="The datetime of the current execution. Used to form execution-specific paths.",
@@ -405,9 +416,16 @@ class MusifyConfig(BaseModel):
     }
 
     @classmethod
-    def from_file(cls, config_file_path: str | Path) -> tuple[Self, dict[str, Self]]:
-        """Create config from the config found in the given ``config_file_path``"""
-        config_map = MultiFileLoader.load(config_file_path)
+    def from_file(
+            cls, config_file_path: str | Path, cache_folder: str | Path | None = None
+    ) -> tuple[Self, dict[str, Self]]:
+        """
+        Create config from the config found in the given ``config_file_path``.
+
+        :param config_file_path: The path of the config file to load.
+        :param cache_folder: When given, cache the parsed config files in this folder.
+        """
+        config_map = MultiFileLoader.load(config_file_path, cache_folder=cache_folder)
 
         functions_map: dict[str, dict[str, Any]] = config_map.pop("functions") if "functions" in config_map else {}
         base = MusifyConfig(**config_map)
@@ -3,6 +3,7 @@ Meta config handling for operations across libraries.
 """
 from collections.abc import Mapping, Iterable
 from functools import partial
+from types import MappingProxyType
 from typing import Self, Annotated, Any
 
 from musify.libraries.local.library import LocalLibrary
@@ -16,15 +17,29 @@ from musify_cli.exception import ParserError
 LIBRARY_TYPES = {str(lib.source) for lib in LOCAL_LIBRARY_CONFIG | REMOTE_LIBRARY_CONFIG}
 
 
-def create_library_config[T: LibraryConfig](kwargs: Any, config_map: Iterable[type[T]]) -> T:
+def get_library_config_map[T: LibraryConfig](configs: Iterable[type[T]]) -> Mapping[str, type[T]]:
+    """Get a read-only map of casefolded library source names to the given library ``configs``."""
+    return MappingProxyType({str(cls.source).casefold(): cls for cls in configs})
+
+
+LOCAL_LIBRARY_CONFIG_MAP = get_library_config_map(LOCAL_LIBRARY_CONFIG)
+REMOTE_LIBRARY_CONFIG_MAP = get_library_config_map(REMOTE_LIBRARY_CONFIG)
+
+
+def create_library_config[T: LibraryConfig](
+        kwargs: Any, config_map: Mapping[str, type[T]] | Iterable[type[T]]
+) -> T:
     """Configure library config from the given input."""
     if isinstance(kwargs, LibraryConfig):
         return kwargs
     elif not isinstance(kwargs, Mapping):
         raise ParserError("Unrecognised input type")
 
+    if not isinstance(config_map, Mapping):
+        config_map = get_library_config_map(config_map)
+
     library_key = kwargs.get(type_key := "type", "").strip().casefold()
-    library_cls = next((cls for cls in config_map if str(cls.source).casefold() == library_key), None)
+    library_cls = config_map.get(library_key)
     if library_cls is None:
         raise ParserError("Unrecognised library type", key=type_key, value=library_key)
 
@@ -33,11 +48,11 @@ def create_library_config[T: LibraryConfig](kwargs: Any, config_map: Iterable[ty
 
 type LocalLibraryType = Annotated[
     LocalLibraryConfig[LocalLibrary, LocalLibraryPaths] | MusicBeeConfig,
-    BeforeValidator(partial(create_library_config, config_map=LOCAL_LIBRARY_CONFIG))
+    BeforeValidator(partial(create_library_config, config_map=LOCAL_LIBRARY_CONFIG_MAP))
 ]
 type RemoteLibraryType = Annotated[
     SpotifyLibraryConfig,
-    BeforeValidator(partial(create_library_config, config_map=REMOTE_LIBRARY_CONFIG))
+    BeforeValidator(partial(create_library_config, config_map=REMOTE_LIBRARY_CONFIG_MAP))
 ]
 
 
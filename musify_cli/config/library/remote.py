@@ -5,6 +5,7 @@ from abc import ABCMeta, abstractmethod
 from collections.abc import Collection
 from copy import copy
 from datetime import timedelta, date, datetime
+from itertools import chain
 from pathlib import Path
 from typing import Literal, ClassVar
 
@@ -115,10 +116,8 @@ class RemoteNewMusicConfig(Runner[tuple[RemotePlaylist, SyncResultRemotePlaylist
         :return: The name of the new playlist and results of the sync as a :py:class:`SyncResultRemotePlaylist` object.
         """
         albums = self._filter_artist_albums_by_date(library)
-        tracks = [
-            track for album in sorted(albums, key=lambda x: (x.year, x.month or 1, x.day or 1), reverse=True)
-            for track in album
-        ]
+        albums_sorted = sorted(albums, key=lambda x: (x.year, x.month or 1, x.day or 1), reverse=True)
+        tracks = list(chain.from_iterable(albums_sorted))
 
         self._logger.info(
             f"\33[1;95m  >\33[1;97m Creating {self.name!r} {library.source} playlist "
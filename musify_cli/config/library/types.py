@@ -2,19 +2,38 @@
 Configures Pydantic types to use as annotations in models.
 """
 from collections.abc import Collection
-from functools import partial
+from functools import partial, cache
 from typing import Annotated
 
 from aiorequestful.types import UnitSequence
+from musify.exception import MusifyError
 from musify.types import MusifyEnum
 from pydantic import BeforeValidator
 
 
+@cache
+def _from_name[T: MusifyEnum](name: str | T, cls: type[T]) -> frozenset[T]:
+    """
+    Get the :py:class:`.MusifyEnum` members for a single enum ``name``, caching results for repeated names.
+    Returns an empty set when the name is not recognised.
+    """
+    if isinstance(name, cls):
+        return frozenset({name})
+    try:
+        return frozenset(cls.from_name(name, fail_on_many=False))
+    except MusifyError:
+        return frozenset()
+
+
 def from_names[T: MusifyEnum](names: Collection[str | T], cls: type[T]) -> Collection[T]:
-    """Get a list of :py:class:`.MusifyEnum` from the given enum ``names``"""
-    if all(name is cls for name in names):
+    """Get a list of unique :py:class:`.MusifyEnum` from the given enum ``names`` in the order they are defined"""
+    if not names or all(isinstance(name, cls) for name in names):
         return names
-    return cls.from_name(*names, fail_on_many=False)
+
+    enums = frozenset().union(*(_from_name(name, cls=cls) for name in names))
+    if not enums:  # raise the appropriate error when no names are recognised
+        return cls.from_name(*names, fail_on_many=False)
+    return [enum for enum in cls if enum in enums]
 
 
 class LoadTypesLocal(MusifyEnum):
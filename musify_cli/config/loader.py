@@ -2,10 +2,15 @@
 Handles loading of config from a config file (e.g. YAML or JSON).
 """
 import json
+import os
+import stat
 from collections.abc import Mapping
-from contextlib import contextmanager
-from io import TextIOWrapper
+from contextlib import contextmanager, suppress
+from datetime import date, datetime
+from hashlib import sha256
+from io import BufferedReader
 from pathlib import Path
+from tempfile import mkstemp
 from typing import Any
 
 import yaml
@@ -13,36 +18,156 @@ from musify.utils import to_collection, merge_maps
 
 from musify_cli.exception import ParserError
 
+try:  # use the faster libyaml backed loader when available
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
-class MultiFileLoader(yaml.SafeLoader):
-    """YAML loader which includes additional YAML files from paths found within a given parent YAML file."""
+
+#: Key used to tag values in cached config data which JSON cannot represent natively
+CACHE_TYPE_KEY = "__type__"
+
+
+def _encode_cache_value(value: Any) -> Any:
+    """
+    Convert the given parsed YAML ``value`` to a JSON compatible value, tagging dates so they can be restored.
+
+    :raise TypeError: If the value cannot be stored as JSON without losing information.
+    """
+    match value:
+        case datetime():
+            return {CACHE_TYPE_KEY: "datetime", "value": value.isoformat()}
+        case date():
+            return {CACHE_TYPE_KEY: "date", "value": value.isoformat()}
+        case dict() if CACHE_TYPE_KEY not in value and all(isinstance(key, str) for key in value):
+            return {key: _encode_cache_value(val) for key, val in value.items()}
+        case list():
+            return list(map(_encode_cache_value, value))
+        case str() | int() | float() | bool() | None:
+            return value
+        case _:
+            raise TypeError(f"Cannot cache value of type {type(value).__name__}")
+
+
+def _decode_cache_object(obj: dict[str, Any]) -> Any:
+    """Restore values tagged by :py:func:`_encode_cache_value` from the given JSON ``obj``"""
+    match obj.get(CACHE_TYPE_KEY):
+        case "datetime":
+            return datetime.fromisoformat(obj["value"])
+        case "date":
+            return date.fromisoformat(obj["value"])
+    return obj
+
+
+class MultiFileLoader(SafeLoader):
+    """
+    YAML loader which includes additional YAML files from paths found within a given parent YAML file.
+
+    When a cache folder is given, parsed YAML files are cached as JSON in this folder and reused on subsequent loads
+    for as long as the source file and all the files it includes remain unmodified.
+    """
 
     @classmethod
-    def load(cls, path: str | Path) -> Any:
+    def load(cls, path: str | Path, cache_folder: str | Path | None = None) -> Any:
         """
         Load a file of any recognised file type by this loader from the given ``path``.
 
         :param path: The path of the file to load.
+        :param cache_folder: When given, cache parsed YAML files in this folder.
         :raise ParserError: If the file type is not recognised.
         """
+        data, _ = cls._load_with_sources(path, cache_folder=cache_folder)
+        return data
+
+    @classmethod
+    def _load_with_sources(
+            cls, path: str | Path, cache_folder: str | Path | None = None
+    ) -> tuple[Any, dict[str, int | None]]:
+        """Load the file at the given ``path``, returning its data and the modified times of all source files"""
         match (path := Path(path)).suffix.casefold():
             case ".json":
-                return cls._load_json(path)
+                return cls._load_json(path), cls._get_sources(path)
             case suffix if suffix in (".yml", ".yaml"):
-                return cls._load_yaml(path)
+                return cls._load_yaml(path, cache_folder=cache_folder)
             case _:
                 raise ParserError("Unrecognised file type", value=path)
 
+    @staticmethod
+    def _get_sources(*paths: str | Path) -> dict[str, int | None]:
+        """Get the modified times for the given ``paths``, giving None for paths which do not exist"""
+        paths = map(Path, paths)
+        return {str(path.resolve()): path.stat().st_mtime_ns if path.is_file() else None for path in paths}
+
     @staticmethod
     @contextmanager
-    def _load_stream(path: str | Path) -> TextIOWrapper:
-        with Path(path).open("r", encoding="utf-8") as stream:
+    def _load_stream(path: str | Path) -> BufferedReader:
+        # binary streams are passed directly to the parsers, which handle decoding themselves
+        with Path(path).open("rb") as stream:
             yield stream
 
+    @staticmethod
+    def _get_cache_path(path: str | Path, cache_folder: str | Path) -> Path:
+        """Get the path of the cache file for the file at the given ``path``"""
+        key = sha256(str(Path(path).resolve()).encode()).hexdigest()
+        return Path(cache_folder, key).with_suffix(".json")
+
     @classmethod
-    def _load_yaml(cls, path: str | Path) -> Any:
+    def _load_yaml(cls, path: str | Path, cache_folder: str | Path | None = None) -> tuple[Any, dict[str, int | None]]:
+        cache_path = cls._get_cache_path(path, cache_folder) if cache_folder is not None else None
+        if cache_path is not None and (cached := cls._load_yaml_cache(cache_path)) is not None:
+            return cached
+
         with cls._load_stream(path) as stream:
-            return yaml.load(stream, cls)
+            loader = cls(stream)
+            loader._cache_folder = cache_folder
+            try:
+                data = loader.get_single_data()
+            finally:
+                loader.dispose()
+
+        sources = cls._get_sources(path) | loader._sources
+        if cache_path is not None:
+            cls._save_yaml_cache(cache_path, data=data, sources=sources, source_path=path)
+        return data, sources
+
+    @classmethod
+    def _load_yaml_cache(cls, path: Path) -> tuple[Any, dict[str, int | None]] | None:
+        """Load cached data from the given ``path``, returning None if the cache is missing or stale"""
+        try:
+            with cls._load_stream(path) as stream:
+                cache = json.load(stream, object_hook=_decode_cache_object)
+            sources: dict[str, int | None] = cache["sources"]
+            if cls._get_sources(*sources) != sources:
+                return
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+
+        return cache["data"], sources
+
+    @staticmethod
+    def _save_yaml_cache(path: Path, data: Any, sources: dict[str, int | None], source_path: str | Path) -> None:
+        """
+        Save the given parsed ``data`` to the cache at the given ``path`` when it can be stored as JSON losslessly.
+        The cache file is written atomically and given the same permissions as the file at ``source_path``
+        while always remaining writable by its owner so that it may be replaced when stale.
+        """
+        try:
+            cache = json.dumps({"sources": sources, "data": _encode_cache_value(data)})
+        except (TypeError, ValueError):  # e.g. non-string keys or unsupported types
+            return
+
+        temp_path = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                file.write(cache)
+            os.chmod(temp_path, stat.S_IMODE(Path(source_path).stat().st_mode) | stat.S_IWUSR)
+            os.replace(temp_path, path)
+        except OSError:  # e.g. read-only file system
+            if temp_path is not None:
+                with suppress(OSError):
+                    Path(temp_path).unlink(missing_ok=True)
 
     @classmethod
     def _load_json(cls, path: str | Path) -> Any:
@@ -57,6 +182,8 @@ class MultiFileLoader(yaml.SafeLoader):
             self._parent_path = Path.cwd()
 
         self._include_key = "include"
+        self._sources: dict[str, int | None] = {}
+        self._cache_folder: str | Path | None = None
 
     def construct_mapping(self, node: yaml.MappingNode, deep: bool = True):
         """Construct mapping object and apply line and column numbers"""
@@ -69,9 +196,11 @@ class MultiFileLoader(yaml.SafeLoader):
             if not path.is_absolute() and isinstance(self._parent_path, Path):
                 path = self._parent_path.joinpath(path)
             if not path.is_file():
+                self._sources |= self._get_sources(path)
                 continue
 
-            include = self.load(path)
+            include, sources = self._load_with_sources(path, cache_folder=self._cache_folder)
+            self._sources |= sources
             if isinstance(include, Mapping):
                 merge_maps(mapping, include, extend=False, overwrite=False)
             else:
@@ -3,6 +3,7 @@ Unifies :py:class:`.Getter` and :py:class:`.Setter` handling for algorithmic set
 """
 from collections.abc import Mapping, Collection
 from dataclasses import dataclass, field
+from functools import cache
 from typing import Any, Self
 
 from musify.base import MusifyItemSettable
@@ -17,8 +18,17 @@ from pydantic_core import CoreSchema, core_schema
 from musify_cli.config.operations.filters import get_comparers_filter
 from musify_cli.config.operations.tagger._setter import Setter, setter_from_config
 
+#: Keys in a rule set config which configure the rule set itself rather than a tag field to set
+RULE_SET_KEYS: frozenset[str] = frozenset({"filter", "field"})
 
-@dataclass
+
+@cache
+def get_field_from_name(name: str) -> LocalTrackField:
+    """Get the :py:class:`.LocalTrackField` for the given ``name``, caching the result for repeated names"""
+    return next(iter(LocalTrackField.from_name(name)))
+
+
+@dataclass(slots=True)
 class FilteredSetter[T: MusifyItemSettable](PrettyPrinter):
     """Stores the settings to apply setters to a limited set of filtered items based on a configured filter."""
     filter: Filter[T] | None = field(default_factory=FilterDefinedList)
@@ -76,8 +86,8 @@ class Tagger[T: MusifyItemSettable](PrettyPrinter):
                     condition = get_comparers_filter(filter_config)
 
                 setters = [
-                    setter_from_config(next(iter(LocalTrackField.from_name(fld))), rule_config)
-                    for fld, rule_config in rule_set.items() if fld not in ["filter", "field"]
+                    setter_from_config(get_field_from_name(fld), rule_config)
+                    for fld, rule_config in rule_set.items() if fld not in RULE_SET_KEYS
                 ]
                 setter = FilteredSetter[LocalTrack](filter=condition, setters=setters)
 
@@ -96,18 +106,35 @@ class Tagger[T: MusifyItemSettable](PrettyPrinter):
         :param collections: The collections the given items belong to.
             Each item must to exactly one collection for this function to work as expected.
         """
-        matched = set()
+        if not self.rules:
+            return
+        if not isinstance(items, list | tuple):  # items are iterated once per rule, materialise them only once
+            items = tuple(items)
+
+        # map each item to the first collection it belongs to for constant time lookups
+        collections_map: dict[int, Collection[T]] = {}
+        for coll in collections:
+            for item in coll:
+                collections_map.setdefault(id(item), coll)
+
+        matched: set[T] = set()
         for rule in self.rules:
+            filtered_items: Collection[T]
             if rule.filter is None:
                 filtered_items = [item for item in items if item not in matched]
             else:
                 filtered_items = rule.filter(items)
+            if not filtered_items:
+                continue
             matched.update(set(filtered_items))
 
+            items_collections: list[tuple[T, Collection[T]]] = [
+                (item, collections_map.get(id(item), ())) for item in filtered_items
+            ]
             for setter in rule.setters:
-                for item in filtered_items:
-                    collection = next(iter(coll for coll in collections if item in coll), ())
-                    setter.set(item, collection)
+                set_tag = setter.set
+                for item, collection in items_collections:
+                    set_tag(item, collection)
 
     def as_dict(self):
         return {"rules": self.rules}
@@ -18,7 +18,7 @@ from musify.base import MusifyItem
 from musify.libraries.collection import BasicCollection
 from musify.libraries.local.track.field import LocalTrackField
 from musify.logger import MusifyLogger, STAT
-from musify.processors.base import dynamicprocessormethod, DynamicProcessor
+from musify.processors.base import dynamicprocessormethod, DynamicProcessor, Filter
 from musify.report import report_playlist_differences, report_missing_tags
 
 from musify_cli.config.core import MusifyConfig, Paths
@@ -160,7 +160,12 @@ class MusifyProcessor(DynamicProcessor, AsyncContextManager):
     ###########################################################################
     def filter[T: Collection](self, items: T) -> T:
         """Run the generic filter on the given ``items`` if configured."""
-        if (filter_ := self.config.pre_post.filter) is not None and filter_.ready:
+        return self._maybe_filter(self.config.pre_post.filter, items)
+
+    @staticmethod
+    def _maybe_filter[T: Collection](filter_: Filter | None, items: T) -> T:
+        """Run the given ``filter_`` on the given ``items`` only if it is configured."""
+        if filter_ is not None and filter_.ready:
             return filter_(items)
         return items
 
@@ -387,8 +392,8 @@ class MusifyProcessor(DynamicProcessor, AsyncContextManager):
         await self.local.load(types=[LoadTypesLocal.TRACKS, LoadTypesLocal.PLAYLISTS])
         await self.remote.load(types=[LoadTypesRemote.PLAYLISTS])
 
-        source = config.filter(self.local.library.playlists.values())
-        reference = config.filter(self.remote.library.playlists.values())
+        source = self._maybe_filter(config.filter, self.local.library.playlists.values())
+        reference = self._maybe_filter(config.filter, self.remote.library.playlists.values())
         return report_playlist_differences(source=source, reference=reference)
 
     async def _report_missing_tags(self) -> dict[str, dict[MusifyItem, tuple[str, ...]]]:
@@ -399,5 +404,5 @@ class MusifyProcessor(DynamicProcessor, AsyncContextManager):
 
         await self.local.load(types=LoadTypesLocal.TRACKS)
 
-        source = config.filter(self.local.library.albums)
+        source = self._maybe_filter(config.filter, self.local.library.albums)
         return report_missing_tags(collections=source, tags=config.tags, match_all=config.match_all)
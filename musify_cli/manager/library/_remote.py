@@ -253,10 +253,10 @@ class RemoteLibraryManager[L: RemoteLibrary, C: RemoteLibraryConfig](LibraryMana
 
     async def _load_followed_artist_albums(self) -> None:
         """Load all followed artists and all their albums to the library, refreshing if necessary."""
-        load_albums = any([
-            LoadTypesRemote.SAVED_ARTISTS not in self.types_loaded,
-            EnrichTypesRemote.ALBUMS not in self.types_enriched.get(LoadTypesRemote.SAVED_ARTISTS, [])
-        ])
+        load_albums = (
+            LoadTypesRemote.SAVED_ARTISTS not in self.types_loaded
+            or EnrichTypesRemote.ALBUMS not in self.types_enriched.get(LoadTypesRemote.SAVED_ARTISTS, set())
+        )
         if load_albums:
             await self.load(types=[LoadTypesRemote.SAVED_ARTISTS])
             await self.library.enrich_saved_artists(types=("album", "single"))
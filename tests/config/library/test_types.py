@@ -0,0 +1,22 @@
+from musify_cli.config.library.types import from_names, LoadTypesRemote
+
+
+def test_from_names_returns_enums_unchanged():
+    names = [LoadTypesRemote.PLAYLISTS, LoadTypesRemote.SAVED_TRACKS]
+    assert from_names(names, cls=LoadTypesRemote) is names
+    assert from_names((), cls=LoadTypesRemote) == ()
+
+
+def test_from_names_resolves_strings():
+    names = ["playlists", "saved_tracks"]
+    assert from_names(names, cls=LoadTypesRemote) == [LoadTypesRemote.PLAYLISTS, LoadTypesRemote.SAVED_TRACKS]
+
+
+def test_from_names_removes_duplicates():
+    names = ["saved_tracks", "playlists", "saved_tracks"]
+    assert from_names(names, cls=LoadTypesRemote) == [LoadTypesRemote.PLAYLISTS, LoadTypesRemote.SAVED_TRACKS]
+
+
+def test_from_names_skips_unrecognised_names():
+    names = ["playlists", "i am not a valid name"]
+    assert from_names(names, cls=LoadTypesRemote) == [LoadTypesRemote.PLAYLISTS]
@@ -7,7 +7,7 @@ from musify.processors.filter import FilterDefinedList
 
 from musify_cli.config.operations.tagger import FilteredSetter, Tagger
 # noinspection PyProtectedMember
-from musify_cli.config.operations.tagger._setter import Setter, Value
+from musify_cli.config.operations.tagger._setter import Setter, Value, Incremental
 from tests.utils import random_tracks
 
 
@@ -53,3 +53,39 @@ class TestTagger:
                     assert track[field] == value
                 else:
                     assert track[field] != value
+
+    def test_set_values_uses_item_collection(self):
+        tracks = random_tracks(30)
+        collections = [tracks[:10], tracks[10:25], tracks[25:]]
+
+        filtered_setter = FilteredSetter(filter=None, setters=[Incremental(field=LocalTrackField.TRACK)])
+        tagger = Tagger(rules=[filtered_setter])
+        tagger.set_tags(tracks, collections)
+
+        for collection in collections:
+            assert sorted(track.track_number for track in collection) == list(range(1, len(collection) + 1))
+
+    def test_set_values_with_shared_filter(self):
+        tracks = random_tracks(30)
+        tracks_group = sample(tracks, k=15)
+        for track in tracks_group:
+            track.album = "i am an album name"
+            track.track_number = 1
+
+        filter_ = FilterDefinedList(values="i am an album name")
+        filter_.transform = lambda tr: tr.album
+
+        # first rule modifies the field the shared filter matches on so the second rule should match nothing
+        filtered_setter_album = FilteredSetter(
+            filter=filter_, setters=[Value(field=LocalTrackField.ALBUM, value="new album name")]
+        )
+        filtered_setter_track = FilteredSetter(
+            filter=filter_, setters=[Value(field=LocalTrackField.TRACK, value=9200)]
+        )
+
+        tagger = Tagger(rules=[filtered_setter_album, filtered_setter_track])
+        tagger.set_tags(tracks, ())
+
+        for track in tracks_group:
+            assert track.album == "new album name"
+            assert track.track_number == 1
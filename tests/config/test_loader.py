@@ -1,10 +1,14 @@
 import json
+import os
+import stat
 from copy import deepcopy
+from datetime import date, datetime
 from pathlib import Path
 from typing import Any
 
 import pytest
 import yaml
+from pytest_mock import MockerFixture
 
 from musify_cli.config.loader import MultiFileLoader
 from musify_cli.exception import ParserError
@@ -99,3 +103,69 @@ class TestMultiFileLoader:
 
         with pytest.raises(ParserError):
             MultiFileLoader.load(path_parent)
+
+    def test_load_yaml_from_cache(self, data: dict[str, Any], tmp_path: Path, mocker: MockerFixture):
+        path_parent = tmp_path.joinpath("test.yaml")
+        path_child = tmp_path.joinpath("child.yml")
+        with path_child.open("w") as file:
+            yaml.dump(data, file)
+
+        data_parent = deepcopy(data)
+        data_parent["child"] = {"include": path_child.name}
+        with path_parent.open("w") as file:
+            yaml.dump(data_parent, file)
+        path_parent.chmod(0o600)
+
+        cache_folder = tmp_path.joinpath("cache")
+        expected = deepcopy(data)
+        expected["child"] = deepcopy(data)
+        assert MultiFileLoader.load(path_parent, cache_folder=cache_folder) == expected
+
+        cache_path = MultiFileLoader._get_cache_path(path_parent, cache_folder)
+        assert cache_path.is_file()
+        assert stat.S_IMODE(cache_path.stat().st_mode) == 0o600
+        assert not list(cache_folder.glob("*.tmp"))
+
+        # second load is taken from the cache without parsing any YAML
+        mock = mocker.patch.object(MultiFileLoader, "get_single_data", side_effect=AssertionError("YAML was parsed"))
+        assert MultiFileLoader.load(path_parent, cache_folder=cache_folder) == expected
+        mock.assert_not_called()
+        mocker.stopall()
+
+        # modifying an included file invalidates the parent's cache
+        data["key1"] = "new value"
+        mtime_ns = path_child.stat().st_mtime_ns
+        with path_child.open("w") as file:
+            yaml.dump(data, file)
+        os.utime(path_child, ns=(mtime_ns + 10**9, mtime_ns + 10**9))  # ensure modified time changes
+
+        expected["child"] = deepcopy(data)
+        assert MultiFileLoader.load(path_parent, cache_folder=cache_folder) == expected
+
+    def test_load_yaml_with_dates_from_cache(self, data: dict[str, Any], tmp_path: Path, mocker: MockerFixture):
+        data["date"] = date(2024, 1, 2)
+        data["key3"]["datetime"] = datetime(2024, 1, 2, 10, 11, 12)
+
+        path = tmp_path.joinpath("test.yaml")
+        with path.open("w") as file:
+            yaml.dump(data, file)
+        path.chmod(0o400)  # cache file should remain writable even when the source is read-only
+
+        cache_folder = tmp_path.joinpath("cache")
+        assert MultiFileLoader.load(path, cache_folder=cache_folder) == data
+
+        cache_path = MultiFileLoader._get_cache_path(path, cache_folder)
+        assert cache_path.is_file()
+        assert stat.S_IMODE(cache_path.stat().st_mode) & stat.S_IWUSR
+
+        mock = mocker.patch.object(MultiFileLoader, "get_single_data", side_effect=AssertionError("YAML was parsed"))
+        assert MultiFileLoader.load(path, cache_folder=cache_folder) == data
+        mock.assert_not_called()
+
+    def test_load_yaml_without_cache_folder_writes_no_cache(self, data: dict[str, Any], tmp_path: Path):
+        path = tmp_path.joinpath("test.yaml")
+        with path.open("w") as file:
+            yaml.dump(data, file)
+
+        self.assert_load(data, path)
+        assert list(tmp_path.iterdir()) == [path]